@@ -9,12 +9,15 @@ import yaml
 
 from .pipeline import VideoCreatorAgent
 
+# libyaml-backed safe loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(path)
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    with path.open("rb") as handle:
+        data = yaml.load(handle, Loader=_YAML_LOADER) or {}
     return data
 
 
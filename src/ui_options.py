@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Option tables for the Streamlit UI. They live outside streamlit_app.py because
+# Streamlit re-executes that script on every rerun, while an imported module is
+# built once per process and stays in sys.modules.
+
+# Widget option lists
+EFFECT_OPTIONS = ("steam", "sway", "flicker", "color_drift", "vignette")
+EFFECT_SET = frozenset(EFFECT_OPTIONS)
+POSITION_OPTIONS: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "center": ("(w-text_w)/2", "(h-text_h)/2"),
+    "lower third": ("(w-text_w)/2", "(h-text_h)*0.75"),
+    "top": ("(w-text_w)/2", "(h-text_h)*0.15"),
+})
+POSITION_LABELS = tuple(POSITION_OPTIONS)
+OPENAI_SIZES = ("1792x1024", "1024x1024", "1024x1792")
+ORDERING_OPTIONS = ("name", "modifiedTime", "random")
+MOTION_STYLES = ("smooth", "cinematic", "orbit")
+PRIVACY_OPTIONS = ("public", "unlisted", "private")
+
+# Option -> selectbox index, so stored values map to a default in one lookup
+OPENAI_SIZE_IDX = {value: idx for idx, value in enumerate(OPENAI_SIZES)}
+ORDERING_IDX = {value: idx for idx, value in enumerate(ORDERING_OPTIONS)}
+MOTION_IDX = {value: idx for idx, value in enumerate(MOTION_STYLES)}
+PRIVACY_IDX = {value: idx for idx, value in enumerate(PRIVACY_OPTIONS)}
+POSITION_IDX = {xy: idx for idx, xy in enumerate(POSITION_OPTIONS.values())}
+
+# Only the preset table itself is read-only; apply_preset copies the values it uses.
+PRESETS: Mapping[str, dict[str, dict[str, Any]]] = MappingProxyType({
+    "Cafe Steam": {
+        "visuals": {
+            "image_provider": "openai",
+            "image_prompt": (
+                "cozy coffee shop interior, warm light, soft steam, cinematic, "
+                "empty center space for title text \"{overlay_text}\", high detail"
+            ),
+            "openai_model": "gpt-image-1",
+            "openai_size": "1792x1024",
+            "loop_motion_style": "cinematic",
+            "loop_zoom_amount": 0.015,
+            "loop_pan_amount": 0.08,
+            "loop_effects": ["steam", "flicker", "vignette"],
+            "loop_flicker_amount": 0.01,
+            "loop_vignette_angle": "PI/5",
+            "loop_steam_opacity": 0.08,
+            "loop_steam_blur": 10.0,
+            "loop_steam_noise": 12,
+            "loop_steam_drift_x": 0.02,
+            "loop_steam_drift_y": 0.05,
+        },
+        "text_overlay": {
+            "text": "LOCK IN",
+            "auto_texts": ["LOCK IN", "HYPER FOCUS", "SLOW DOWN"],
+            "auto_mode": "daily",
+            "apply_to_video": False,
+            "create_thumbnail": True,
+            "upload_thumbnail": True,
+            "font_size": 96,
+            "x": "(w-text_w)/2",
+            "y": "(h-text_h)/2",
+        },
+        "upload": {
+            "title_template": "Cafe Steam Chill Mix - Cozy Coffee Shop Ambience - {date}",
+            "description_template": (
+                "Relaxing cafe ambience with gentle steam drift visuals.\n"
+                "Perfect for study, focus, reading, and sleep.\n\n"
+                "New mix daily."
+            ),
+            "tags": [
+                "cafe ambience", "coffee shop ambience", "study music",
+                "focus music", "relaxing mix", "lofi", "chill beats",
+                "background music", "sleep music",
+            ],
+            "category_id": "10",
+        },
+    },
+    "Fireplace Lounge": {
+        "visuals": {
+            "image_provider": "openai",
+            "image_prompt": (
+                "cozy fireplace living room, warm glow, winter evening, "
+                "empty center space for text, high detail, cinematic"
+            ),
+            "loop_motion_style": "smooth",
+            "loop_effects": ["flicker", "vignette"],
+            "loop_flicker_amount": 0.02,
+        },
+        "text_overlay": {
+            "auto_texts": ["RELAX", "UNWIND", "REST"],
+            "auto_mode": "daily",
+        },
+        "upload": {
+            "title_template": "Fireplace Lounge - Cozy Evening Mix - {date}",
+            "tags": ["fireplace", "cozy", "relaxing", "evening", "ambient"],
+        },
+    },
+})
+PRESET_CHOICES: tuple[str, ...] = ("None", *sorted(PRESETS.keys()))
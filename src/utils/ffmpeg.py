@@ -221,6 +221,7 @@ def render_image_with_text(
     input_path: Path,
     output_path: Path,
     drawtext_filter: str,
+    compression_level: int | None = None,
 ) -> None:
     args = [
         "ffmpeg",
@@ -231,8 +232,10 @@ def render_image_with_text(
         drawtext_filter,
         "-frames:v",
         "1",
-        str(output_path),
     ]
+    if compression_level is not None:
+        args += ["-compression_level", str(compression_level)]
+    args.append(str(output_path))
     run_ffmpeg(args)
 
 
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+
+# Defined outside streamlit_app.py, which Streamlit re-executes on every rerun;
+# an imported module stays in sys.modules, so this cache persists.
+@functools.lru_cache(maxsize=256)
+def resolve_path(path_value: str, root: Path) -> Path:
+    """Expand ~ and anchor a relative config path at root."""
+    path = Path(path_value).expanduser()
+    if not path.is_absolute():
+        path = root / path
+    return path
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 import hmac
+import json
 import math
 import random
 import os
@@ -10,28 +12,47 @@ import re
 import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Mapping
 
 import streamlit as st
 import yaml
-from src.utils.ffmpeg import (
-    build_drawtext_filter,
-    generate_color_image,
-    render_image_with_text,
-)
 from src.providers.youtube_oauth import (
     render_youtube_login,
     credentials_configured,
     save_token_to_file,
     get_channel_info,
 )
+from src.ui_options import (
+    EFFECT_OPTIONS,
+    EFFECT_SET,
+    MOTION_IDX,
+    MOTION_STYLES,
+    OPENAI_SIZE_IDX,
+    OPENAI_SIZES,
+    ORDERING_IDX,
+    ORDERING_OPTIONS,
+    POSITION_IDX,
+    POSITION_LABELS,
+    POSITION_OPTIONS,
+    PRESET_CHOICES,
+    PRESETS,
+    PRIVACY_IDX,
+    PRIVACY_OPTIONS,
+)
+from src.utils.paths import resolve_path
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
 # ─────────────────────────────────────────────────────────────────────────────
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.yaml"
+CONFIG_JSON_PATH = CONFIG_PATH.with_suffix(".json")  # fast-load mirror of CONFIG_PATH
 EXAMPLE_CONFIG_PATH = ROOT / "config.example.yaml"
 SECRETS_DIR = ROOT / "secrets"
 ASSETS_DIR = ROOT / "assets"
@@ -40,6 +61,52 @@ SCHEDULE_PID_PATH = RUNS_UI_DIR / "scheduler.pid"
 SCHEDULE_LOG_PATH = RUNS_UI_DIR / "scheduler.log"
 FULLRUN_PID_PATH = RUNS_UI_DIR / "full_run.pid"
 FULLRUN_LOG_PATH = RUNS_UI_DIR / "full_run.log"
+RUN_OUTPUT_REFRESH_SECONDS = 0.5
+RUN_OUTPUT_MAX_LINES = 2000
+_COMPARE_CHUNK = 1 << 20  # bytes read per step when checking a file's content
+CONFIG_SAVING_ACTIONS = ("run_preview", "run_test", "run_full", "start_schedule")
+
+# Separators for comma/newline-delimited list fields (tags, auto texts)
+_LIST_SPLIT = re.compile(r"[,\n\r]+")
+
+# safe_float forms like "PI/4" and "2*PI"; matched after whitespace is removed
+_WHITESPACE = re.compile(r"\s+")
+_PI_LEFT = re.compile(r"^PI([/*])([0-9.]+)$")
+_PI_RIGHT = re.compile(r"^([0-9.]+)([/*])PI$")
+
+# Config values keyed by (section, key); see _flatten
+FlatConfig = dict[tuple[str, str], Any]
+
+# libyaml-backed safe loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Sidebar actions that save the config and then launch a detached agent process.
+BACKGROUND_ACTIONS: dict[str, dict[str, Any]] = {
+    "run_full": {
+        "args": [sys.executable, "-m", "src.agent", "--config", str(CONFIG_PATH), "--once"],
+        "pid_path": FULLRUN_PID_PATH,
+        "log_path": FULLRUN_LOG_PATH,
+        "label": "Full run",
+    },
+    "start_schedule": {
+        "args": [sys.executable, "-m", "src.agent", "--config", str(CONFIG_PATH)],
+        "pid_path": SCHEDULE_PID_PATH,
+        "log_path": SCHEDULE_LOG_PATH,
+        "label": "Schedule",
+    },
+}
+
+# Fixed-destination uploads saved on submit: name -> (tab, widget field, destination).
+# The overlay font is handled separately because its suffix follows the upload.
+UPLOAD_SPECS: dict[str, tuple[str, str, Path]] = {
+    "image": ("visuals", "upload_image", ASSETS_DIR / "image.png"),
+    "loop": ("visuals", "upload_loop", ASSETS_DIR / "loop.mp4"),
+    "youtube_client": ("upload", "upload_youtube_client", SECRETS_DIR / "youtube_client.json"),
+    "service_account": ("audio", "upload_sa", SECRETS_DIR / "drive_service_account.json"),
+    "oauth_client": ("audio", "upload_oauth", SECRETS_DIR / "drive_oauth_client.json"),
+}
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Modern Dark Theme CSS
@@ -380,90 +447,21 @@ CUSTOM_CSS = """
 </style>
 """
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Presets
-# ─────────────────────────────────────────────────────────────────────────────
-PRESETS: dict[str, dict[str, dict[str, Any]]] = {
-    "Cafe Steam": {
-        "visuals": {
-            "image_provider": "openai",
-            "image_prompt": (
-                "cozy coffee shop interior, warm light, soft steam, cinematic, "
-                "empty center space for title text \"{overlay_text}\", high detail"
-            ),
-            "openai_model": "gpt-image-1",
-            "openai_size": "1792x1024",
-            "loop_motion_style": "cinematic",
-            "loop_zoom_amount": 0.015,
-            "loop_pan_amount": 0.08,
-            "loop_effects": ["steam", "flicker", "vignette"],
-            "loop_flicker_amount": 0.01,
-            "loop_vignette_angle": "PI/5",
-            "loop_steam_opacity": 0.08,
-            "loop_steam_blur": 10.0,
-            "loop_steam_noise": 12,
-            "loop_steam_drift_x": 0.02,
-            "loop_steam_drift_y": 0.05,
-        },
-        "text_overlay": {
-            "text": "LOCK IN",
-            "auto_texts": ["LOCK IN", "HYPER FOCUS", "SLOW DOWN"],
-            "auto_mode": "daily",
-            "apply_to_video": False,
-            "create_thumbnail": True,
-            "upload_thumbnail": True,
-            "font_size": 96,
-            "x": "(w-text_w)/2",
-            "y": "(h-text_h)/2",
-        },
-        "upload": {
-            "title_template": "Cafe Steam Chill Mix - Cozy Coffee Shop Ambience - {date}",
-            "description_template": (
-                "Relaxing cafe ambience with gentle steam drift visuals.\n"
-                "Perfect for study, focus, reading, and sleep.\n\n"
-                "New mix daily."
-            ),
-            "tags": [
-                "cafe ambience", "coffee shop ambience", "study music",
-                "focus music", "relaxing mix", "lofi", "chill beats",
-                "background music", "sleep music",
-            ],
-            "category_id": "10",
-        },
-    },
-    "Fireplace Lounge": {
-        "visuals": {
-            "image_provider": "openai",
-            "image_prompt": (
-                "cozy fireplace living room, warm glow, winter evening, "
-                "empty center space for text, high detail, cinematic"
-            ),
-            "loop_motion_style": "smooth",
-            "loop_effects": ["flicker", "vignette"],
-            "loop_flicker_amount": 0.02,
-        },
-        "text_overlay": {
-            "auto_texts": ["RELAX", "UNWIND", "REST"],
-            "auto_mode": "daily",
-        },
-        "upload": {
-            "title_template": "Fireplace Lounge - Cozy Evening Mix - {date}",
-            "tags": ["fireplace", "cozy", "relaxing", "evening", "ambient"],
-        },
-    },
-}
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Utility Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
-def get_app_password() -> str:
+@st.cache_resource(show_spinner=False)
+def get_app_password() -> bytes:
+    """Return the UTF-8 encoded app password, or b"" when none is set."""
+    # Deploy-time constant; changing it requires restarting the app.
     try:
         if "app_password" in st.secrets:
-            return str(st.secrets["app_password"]).strip()
+            return str(st.secrets["app_password"]).strip().encode("utf-8")
     except FileNotFoundError:
         pass
-    return os.getenv("APP_PASSWORD", "").strip()
+    return os.getenv("APP_PASSWORD", "").strip().encode("utf-8")
 
 
 def ensure_runs_dir() -> None:
@@ -499,16 +497,23 @@ def start_background(args: list[str], pid_path: Path, log_path: Path) -> int:
     if existing_pid and is_pid_running(existing_pid):
         return existing_pid
 
-    log_handle = log_path.open("a", encoding="utf-8")
-    kwargs: dict[str, Any] = {"stdout": log_handle, "stderr": log_handle}
+    return _spawn_with_logging(args, pid_path, log_path)
+
+
+def _spawn_with_logging(args: list[str], pid_path: Path, log_path: Path) -> int:
+    """Start a detached process appending to log_path and record its PID."""
+    kwargs: dict[str, Any] = {}
     if os.name == "nt":
         kwargs["creationflags"] = (
             subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
         )
     else:
         kwargs["start_new_session"] = True
-    process = subprocess.Popen(args, **kwargs)
-    log_handle.close()
+    # The child only needs the raw descriptor, so skip the text-mode wrapper.
+    with log_path.open("ab", buffering=0) as log_handle:
+        process = subprocess.Popen(
+            args, stdout=log_handle, stderr=subprocess.STDOUT, **kwargs
+        )
     pid_path.write_text(str(process.pid), encoding="utf-8")
     return process.pid
 
@@ -538,17 +543,51 @@ def run_agent_once_cli(
     config_path: Path,
     test_mode: bool = False,
     test_minutes: int | None = None,
+    on_output: Callable[[str], None] | None = None,
 ) -> tuple[int, str]:
+    """Run the agent once, streaming combined output to on_output as it arrives.
+
+    Only the last RUN_OUTPUT_MAX_LINES lines are kept and returned.
+    """
     args = [sys.executable, "-m", "src.agent", "--config", str(config_path), "--once"]
     if test_mode:
         args.append("--test")
     if test_minutes:
         args += ["--test-minutes", str(test_minutes)]
-    result = subprocess.run(args, capture_output=True, text=True, check=False)
-    output = (result.stdout or "").strip()
-    if result.stderr:
-        output = f"{output}\n{result.stderr.strip()}".strip()
-    return result.returncode, output
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    lines: deque[str] = deque(maxlen=RUN_OUTPUT_MAX_LINES)
+    last_refresh = 0.0
+    try:
+        for line in process.stdout:
+            lines.append(line.rstrip("\n"))
+            now = time.monotonic()
+            if on_output and now - last_refresh >= RUN_OUTPUT_REFRESH_SECONDS:
+                on_output("\n".join(lines))
+                last_refresh = now
+    except BaseException:
+        # on_output raises Streamlit's rerun/stop exceptions when the user interacts
+        # or the session closes; let the run finish and be reaped off the script thread.
+        threading.Thread(target=_drain_and_reap, args=(process,), daemon=True).start()
+        raise
+    process.stdout.close()
+    returncode = process.wait()
+    if on_output and lines:
+        on_output("\n".join(lines))
+    return returncode, "\n".join(lines).strip()
+
+
+def _drain_and_reap(process: subprocess.Popen) -> None:
+    """Keep reading a child's output so it never blocks on a full pipe, then reap it."""
+    with process.stdout:
+        for _ in process.stdout:
+            pass
+    process.wait()
 
 
 def require_password() -> bool:
@@ -559,7 +598,7 @@ def require_password() -> bool:
         return True
 
     def password_entered() -> None:
-        entered = st.session_state.get("password", "")
+        entered = st.session_state.get("password", "").encode("utf-8")
         if hmac.compare_digest(entered, app_password):
             st.session_state["password_ok"] = True
             st.session_state["password"] = ""
@@ -579,49 +618,203 @@ def require_password() -> bool:
     return st.session_state.get("password_ok", False)
 
 
+def _file_stamp(stat: os.stat_result) -> list[int]:
+    """Identify one version of a file by (mtime_ns, size)."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
 def load_config() -> dict[str, Any]:
     if CONFIG_PATH.exists():
-        return yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
+        yaml_stamp = _file_stamp(CONFIG_PATH.stat())
+        try:
+            sidecar = _load_config_cached(str(CONFIG_JSON_PATH), _file_stamp(CONFIG_JSON_PATH.stat()))
+        except (FileNotFoundError, ValueError):
+            sidecar = None
+        # Only trust the sidecar for the exact YAML it was written from; a copied or
+        # restored config.yaml can carry an older mtime than the sidecar.
+        if isinstance(sidecar, dict) and sidecar.get("yaml_stamp") == yaml_stamp:
+            return sidecar["config"]
+        config = _load_config_cached(str(CONFIG_PATH), yaml_stamp)
+        # Refresh the sidecar now so later sessions skip the YAML parse.
+        try:
+            _write_json_sidecar(config, yaml_stamp)
+        except OSError:
+            pass  # read-only checkout; keep loading from YAML
+        return config
     if EXAMPLE_CONFIG_PATH.exists():
-        return yaml.safe_load(EXAMPLE_CONFIG_PATH.read_text(encoding="utf-8")) or {}
+        return _load_config_cached(str(EXAMPLE_CONFIG_PATH), _file_stamp(EXAMPLE_CONFIG_PATH.stat()))
     return {}
 
 
+@st.cache_data(show_spinner=False)
+def _load_config_cached(path_str: str, stamp: list[int]) -> dict[str, Any]:
+    # stamp is only part of the cache key, so external edits are picked up.
+    with open(path_str, "rb") as handle:
+        if path_str.endswith(".json"):
+            return json.load(handle)
+        return yaml.load(handle, Loader=_YAML_LOADER) or {}
+
+
+def _atomic_write(path: Path, data: bytes) -> os.stat_result:
+    """Write then rename so a reader never sees a half-written file.
+
+    Returns the stat of the written file, taken before it replaced path.
+    """
+    # A unique temp name in the same folder keeps concurrent sessions from
+    # sharing one temp file and keeps os.replace on a single filesystem.
+    tmp_path = path.with_name(f".{path.name}.{os.urandom(8).hex()}.tmp")
+    # Created like a plain open() would (0666 minus the umask, applied by the OS);
+    # O_EXCL guarantees the file is new.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            written = os.fstat(handle.fileno())
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(tmp_path, mode)  # an existing target keeps its permissions
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _file_holds(path: Path, data: bytes | memoryview) -> bool:
+    """True if path exists with exactly these bytes; sizes are compared first."""
+    view = memoryview(data)
+    try:
+        if path.stat().st_size != len(view):
+            return False
+        # Chunked so large uploads are never read whole and stop at the first difference.
+        with path.open("rb") as handle:
+            for start in range(0, len(view), _COMPARE_CHUNK):
+                if handle.read(_COMPARE_CHUNK) != view[start:start + _COMPARE_CHUNK]:
+                    return False
+        return True
+    except FileNotFoundError:
+        return False
+
+
 def save_config(config: dict[str, Any]) -> None:
-    text = yaml.safe_dump(config, sort_keys=False)
-    CONFIG_PATH.write_text(text, encoding="utf-8")
+    text = yaml.dump(
+        config,
+        Dumper=_YAML_DUMPER,
+        sort_keys=False,
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+    data = text.encode("utf-8")
+    if _file_holds(CONFIG_PATH, data):
+        # Leave an identical file (and its stamp-keyed cache) untouched; a stale
+        # sidecar is regenerated by load_config.
+        return
+    written = _atomic_write(CONFIG_PATH, data)
+    # The sidecar is only a cache; an old one no longer matches the new YAML's stamp.
+    try:
+        _write_json_sidecar(config, _file_stamp(written))
+    except OSError:
+        pass  # locked or read-only config.json; the YAML is read instead
+    _load_config_cached.clear()
+
+
+def _write_json_sidecar(config: dict[str, Any], yaml_stamp: list[int]) -> None:
+    """Mirror config to JSON, tagged with the stamp of the YAML it matches."""
+    try:
+        text = json.dumps({"yaml_stamp": yaml_stamp, "config": config})
+        # json turns non-str keys into strings and NaN never compares equal; only a
+        # sidecar that loads back as exactly this config may stand in for the YAML.
+        if json.loads(text)["config"] != config:
+            raise ValueError("config does not round-trip through JSON")
+        _atomic_write(CONFIG_JSON_PATH, text.encode("utf-8"))
+    except (TypeError, ValueError):
+        # Not representable as JSON; drop any stale sidecar so the YAML is read.
+        CONFIG_JSON_PATH.unlink(missing_ok=True)
+
+
+def _flatten(config: dict[str, Any]) -> FlatConfig:
+    """Index every section value by (section, key) for single-lookup reads."""
+    flat = {
+        (section, key): value
+        for section, values in config.items()
+        if isinstance(values, dict)
+        for key, value in values.items()
+    }
+    # Older configs store effects as "steam, flicker"; normalize once here.
+    effects = flat.get(("visuals", "loop_effects"))
+    if isinstance(effects, str):
+        flat[("visuals", "loop_effects")] = split_tags(effects)
+    return flat
+
 
+def set_config(config: dict[str, Any]) -> None:
+    """Store the session config with its flat view, rebuilt only on change."""
+    st.session_state.config = config
+    st.session_state.config_flat = _flatten(config)
 
-def cfg(config: dict[str, Any], section: str, key: str, default: Any) -> Any:
-    return config.get(section, {}).get(key, default)
+
+def cfg(flat: FlatConfig, section: str, key: str, default: Any) -> Any:
+    return flat.get((section, key), default)
+
+
+def fcfg(flat: FlatConfig, section: str, key: str, default: float) -> float:
+    value = flat.get((section, key), default)
+    return value if type(value) is float else float(value)
 
 
 def path_for_config(path: Path) -> str:
-    try:
-        return str(path.relative_to(ROOT))
-    except ValueError:
-        return str(path)
+    return str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+
+
+def _ext(name: str, default: str) -> str:
+    """File extension of an upload name, with its dot, or default when it has none."""
+    _, dot, ext = name.rpartition(".")
+    return f".{ext}" if dot and ext else default
 
 
 def save_uploaded_file(upload, dest_path: Path) -> str:
+    """Write one upload; the destination folder must already exist.
+
+    The write is skipped when dest_path already holds the same content.
+    """
     if upload is None:
         return ""
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-    dest_path.write_bytes(upload.getvalue())
+    # A view of the upload's in-memory buffer; comparing and writing it needs no copy.
+    _write_bytes_if_changed(dest_path, upload.getbuffer())
     return path_for_config(dest_path)
 
 
+def save_uploaded_files(uploads: dict[str, tuple[Any, Path]]) -> dict[str, str]:
+    """Save every provided upload, creating each destination folder once.
+
+    Returns the config path of each saved upload by name; missing uploads are skipped.
+    """
+    pending = {name: pair for name, pair in uploads.items() if pair[0] is not None}
+    for parent in {dest.parent for _, dest in pending.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+    if len(pending) < 2:
+        return {name: save_uploaded_file(upload, dest) for name, (upload, dest) in pending.items()}
+    # Each upload has its own destination, so the writes can overlap.
+    with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+        futures = {
+            name: executor.submit(save_uploaded_file, upload, dest)
+            for name, (upload, dest) in pending.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
 def split_tags(text: str) -> list[str]:
-    return [tag.strip() for tag in text.split(",") if tag.strip()]
+    return [tag for tag in (part.strip() for part in _LIST_SPLIT.split(text)) if tag]
 
 
 def split_text_lines(text: str) -> list[str]:
     if not text:
         return []
-    entries: list[str] = []
-    for line in text.splitlines():
-        entries.extend(line.split(","))
-    return [item.strip() for item in entries if item.strip()]
+    return [item for item in (part.strip() for part in _LIST_SPLIT.split(text)) if item]
 
 
 def select_overlay_text(overlay_text: str, auto_texts: list[str], mode: str) -> str:
@@ -636,13 +829,6 @@ def select_overlay_text(overlay_text: str, auto_texts: list[str], mode: str) ->
     return auto_texts[idx]
 
 
-def resolve_path(path_value: str) -> Path:
-    path = Path(path_value).expanduser()
-    if not path.is_absolute():
-        path = ROOT / path
-    return path
-
-
 def safe_float(value: Any, default: float) -> float:
     """Safely convert a value to float, supporting PI expressions."""
     if value is None:
@@ -657,10 +843,10 @@ def safe_float(value: Any, default: float) -> float:
             return float(text)
         except ValueError:
             pass
-        normalized = re.sub(r"\s+", "", text).upper()
+        normalized = _WHITESPACE.sub("", text).upper()
         if normalized == "PI":
             return math.pi
-        match = re.match(r"^PI([/*])([0-9.]+)$", normalized)
+        match = _PI_LEFT.match(normalized)
         if match:
             op, num_str = match.groups()
             try:
@@ -668,7 +854,7 @@ def safe_float(value: Any, default: float) -> float:
             except ValueError:
                 return default
             return math.pi / number if op == "/" else math.pi * number
-        match = re.match(r"^([0-9.]+)([/*])PI$", normalized)
+        match = _PI_RIGHT.match(normalized)
         if match:
             num_str, op = match.groups()
             try:
@@ -679,6 +865,7 @@ def safe_float(value: Any, default: float) -> float:
     return default
 
 
+@st.cache_resource(ttl=3600)
 def default_fontfile() -> Path | None:
     if os.name != "nt":
         return None
@@ -693,13 +880,82 @@ def default_fontfile() -> Path | None:
     return None
 
 
-def apply_preset(config: dict[str, Any], preset: dict[str, dict[str, Any]]) -> dict[str, Any]:
+def apply_preset(config: dict[str, Any], preset: Mapping[str, Mapping[str, Any]]) -> dict[str, Any]:
+    # Copy list values so the session config never aliases the shared preset lists.
     for section, values in preset.items():
-        section_map = config.setdefault(section, {})
-        section_map.update(values)
+        config[section] = {
+            **(config.get(section) or {}),
+            **{key: list(value) if isinstance(value, list) else value for key, value in values.items()},
+        }
     return config
 
 
+def _write_bytes_if_changed(path: Path, data: bytes | memoryview) -> None:
+    """Write data unless path already holds exactly these bytes."""
+    if not _file_holds(path, data):
+        path.write_bytes(data)
+
+
+def _preview_image_from_upload(visuals: dict[str, Any], preview_dir: Path, resolution: str) -> Path | None:
+    upload = visuals["upload_image"]
+    suffix = _ext(upload.name, ".png")
+    preview_image_path = preview_dir / f"preview_base{suffix}"
+    _write_bytes_if_changed(preview_image_path, upload.getbuffer())
+    return preview_image_path
+
+
+def _preview_image_from_path(visuals: dict[str, Any], preview_dir: Path, resolution: str) -> Path | None:
+    resolved = resolve_path(visuals["image_path"], ROOT)
+    return resolved if resolved.exists() else None
+
+
+def _preview_image_from_background(visuals: dict[str, Any], preview_dir: Path, resolution: str) -> Path | None:
+    from src.utils.ffmpeg import generate_color_image
+
+    color = visuals.get("background_color", "black")
+    # A solid background only depends on color and size, so reuse it.
+    background_key = hashlib.blake2b(f"{color}\0{resolution}".encode("utf-8"), digest_size=8).hexdigest()
+    preview_image_path = preview_dir / f"preview_background_{background_key}.png"
+    if not preview_image_path.exists():
+        # Render to a temp file and rename only on success, so an interrupted ffmpeg
+        # run never leaves a truncated PNG behind to be reused.
+        fd, tmp_name = tempfile.mkstemp(dir=preview_dir, prefix=".preview_background_", suffix=".png")
+        os.close(fd)
+        try:
+            generate_color_image(Path(tmp_name), resolution=resolution, color=color)
+            os.replace(tmp_name, preview_image_path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+    return preview_image_path
+
+
+# Preview image sources in precedence order; the first key set in the visuals decides.
+PREVIEW_IMAGE_SOURCES = (
+    ("upload_image", _preview_image_from_upload),
+    ("image_path", _preview_image_from_path),
+    ("auto_background", _preview_image_from_background),
+)
+
+
+def resolve_preview_image(visuals: dict[str, Any], preview_dir: Path, resolution: str) -> Path | None:
+    for key, handler in PREVIEW_IMAGE_SOURCES:
+        if visuals.get(key):
+            return handler(visuals, preview_dir, resolution)
+    return None
+
+
+def preview_render_key(drawtext_filter: str, text: str, *paths: Path | None) -> bytes:
+    """Digest of everything a thumbnail preview render depends on."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(drawtext_filter.encode("utf-8"))
+    digest.update(text.encode("utf-8"))
+    for path in paths:
+        if path is not None:
+            stat = path.stat()
+            digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}".encode("utf-8"))
+    return digest.digest()
+
+
 def get_recent_runs() -> list[Path]:
     """Get list of recent run directories"""
     runs_dir = ROOT / "runs"
@@ -735,7 +991,7 @@ def render_status_card(title: str, value: str, status: str = "idle") -> None:
     """, unsafe_allow_html=True)
 
 
-def render_sidebar(config: dict[str, Any], demo_mode: bool) -> dict[str, bool]:
+def render_sidebar(flat: FlatConfig, demo_mode: bool) -> dict[str, bool]:
     """Render the sidebar with status and controls. Returns action flags."""
     actions = {
         "run_test": False,
@@ -764,7 +1020,7 @@ def render_sidebar(config: dict[str, Any], demo_mode: bool) -> dict[str, bool]:
 
     # Schedule status
     if sched_running:
-        daily_time = cfg(config, "schedule", "daily_time", "03:00")
+        daily_time = cfg(flat, "schedule", "daily_time", "03:00")
         st.sidebar.markdown(f"""
             <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 1rem;">
                 <span style="width: 8px; height: 8px; background: #6366f1; border-radius: 50%; display: inline-block;" class="pulse"></span>
@@ -848,7 +1104,7 @@ def render_sidebar(config: dict[str, Any], demo_mode: bool) -> dict[str, bool]:
     return actions
 
 
-def render_dashboard_tab(config: dict[str, Any]) -> None:
+def render_dashboard_tab(flat: FlatConfig) -> None:
     """Render the dashboard/overview tab"""
 
     # Status cards row
@@ -864,7 +1120,7 @@ def render_dashboard_tab(config: dict[str, Any]) -> None:
 
     with col2:
         status = "running" if sched_running else "idle"
-        value = cfg(config, "schedule", "daily_time", "03:00") if sched_running else "Off"
+        value = cfg(flat, "schedule", "daily_time", "03:00") if sched_running else "Off"
         render_status_card("Schedule", value, status)
 
     with col3:
@@ -884,31 +1140,31 @@ def render_dashboard_tab(config: dict[str, Any]) -> None:
 
     with col1:
         st.markdown("**Audio**")
-        source = cfg(config, "audio", "source", "local")
+        source = cfg(flat, "audio", "source", "local")
         if source == "local":
-            folder = cfg(config, "audio", "local_folder", "Not set")
+            folder = cfg(flat, "audio", "local_folder", "Not set")
             st.caption(f"Local: `{folder}`")
         else:
-            folder_id = cfg(config, "audio", "drive_folder_id", "Not set")
+            folder_id = cfg(flat, "audio", "drive_folder_id", "Not set")
             st.caption(f"Drive: `{folder_id[:20]}...`" if len(str(folder_id)) > 20 else f"Drive: `{folder_id}`")
 
-        minutes_min = cfg(config, "audio", "target_minutes_min", None)
-        minutes_max = cfg(config, "audio", "target_minutes_max", None)
+        minutes_min = cfg(flat, "audio", "target_minutes_min", None)
+        minutes_max = cfg(flat, "audio", "target_minutes_max", None)
         if minutes_min is not None:
             st.caption(f"Duration: {minutes_min}-{minutes_max} minutes")
         else:
-            hours_min = cfg(config, "audio", "target_hours_min", 8)
-            hours_max = cfg(config, "audio", "target_hours_max", 9)
+            hours_min = cfg(flat, "audio", "target_hours_min", 8)
+            hours_max = cfg(flat, "audio", "target_hours_max", 9)
             st.caption(f"Duration: {hours_min}-{hours_max} hours")
 
     with col2:
         st.markdown("**Visuals**")
-        image_provider = cfg(config, "visuals", "image_provider", "openai")
-        loop_provider = cfg(config, "visuals", "loop_provider", "ffmpeg")
+        image_provider = cfg(flat, "visuals", "image_provider", "openai")
+        loop_provider = cfg(flat, "visuals", "loop_provider", "ffmpeg")
         st.caption(f"Image: {image_provider}")
         st.caption(f"Loop: {loop_provider}")
 
-        effects = cfg(config, "visuals", "loop_effects", [])
+        effects = cfg(flat, "visuals", "loop_effects", [])
         if effects:
             st.caption(f"Effects: {', '.join(effects)}")
 
@@ -943,7 +1199,7 @@ def render_dashboard_tab(config: dict[str, Any]) -> None:
                 st.caption("No log content")
 
 
-def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
+def render_audio_tab(flat: FlatConfig) -> dict[str, Any]:
     """Render audio configuration tab"""
     audio_config = {}
 
@@ -952,7 +1208,7 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
     audio_source_label = st.selectbox(
         "Source",
         ["Local folder", "Google Drive"],
-        index=0 if cfg(config, "audio", "source", "drive") == "local" else 1,
+        index=0 if cfg(flat, "audio", "source", "drive") == "local" else 1,
     )
     audio_config["source"] = "local" if audio_source_label == "Local folder" else "drive"
 
@@ -961,13 +1217,13 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
         with col1:
             audio_config["local_folder"] = st.text_input(
                 "Folder path",
-                cfg(config, "audio", "local_folder", ""),
+                cfg(flat, "audio", "local_folder", ""),
                 placeholder="C:\\Users\\Music or /home/user/music"
             )
         with col2:
             audio_config["recursive"] = st.checkbox(
                 "Recursive",
-                value=bool(cfg(config, "audio", "recursive", False)),
+                value=bool(cfg(flat, "audio", "recursive", False)),
                 help="Scan subfolders"
             )
 
@@ -979,34 +1235,31 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
     else:
         audio_config["drive_folder_id"] = st.text_input(
             "Google Drive folder ID",
-            cfg(config, "audio", "drive_folder_id", ""),
+            cfg(flat, "audio", "drive_folder_id", ""),
             help="The ID from the Drive folder URL"
         )
-        audio_config["local_folder"] = cfg(config, "audio", "local_folder", "")
-        audio_config["recursive"] = cfg(config, "audio", "recursive", False)
+        audio_config["local_folder"] = cfg(flat, "audio", "local_folder", "")
+        audio_config["recursive"] = cfg(flat, "audio", "recursive", False)
         audio_config["uploaded_files"] = []
 
     st.markdown("### Playlist Settings")
 
     col1, col2 = st.columns(2)
     with col1:
-        ordering_options = ["name", "modifiedTime", "random"]
-        current_ordering = cfg(config, "audio", "ordering", "name")
-        ordering_index = ordering_options.index(current_ordering) if current_ordering in ordering_options else 0
         audio_config["ordering"] = st.selectbox(
             "Ordering",
-            ordering_options,
-            index=ordering_index,
+            ORDERING_OPTIONS,
+            index=ORDERING_IDX.get(cfg(flat, "audio", "ordering", "name"), 0),
             help="name = alphabetical, modifiedTime = newest first, random = shuffled"
         )
     with col2:
         audio_config["repeat_playlist"] = st.checkbox(
             "Repeat to fill duration",
-            value=bool(cfg(config, "audio", "repeat_playlist", True)),
+            value=bool(cfg(flat, "audio", "repeat_playlist", True)),
         )
 
     # Duration mode selector
-    has_minutes_config = cfg(config, "audio", "target_minutes_min", None) is not None
+    has_minutes_config = cfg(flat, "audio", "target_minutes_min", None) is not None
     duration_mode = st.radio(
         "Duration unit",
         ["Hours", "Minutes"],
@@ -1021,14 +1274,14 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
             audio_config["target_hours_min"] = st.number_input(
                 "Min hours",
                 min_value=0.0, max_value=24.0, step=0.5,
-                value=float(cfg(config, "audio", "target_hours_min", 8)),
+                value=fcfg(flat, "audio", "target_hours_min", 8),
                 disabled=not audio_config["repeat_playlist"],
             )
         with col2:
             audio_config["target_hours_max"] = st.number_input(
                 "Max hours",
                 min_value=0.0, max_value=24.0, step=0.5,
-                value=float(cfg(config, "audio", "target_hours_max", 9)),
+                value=fcfg(flat, "audio", "target_hours_max", 9),
                 disabled=not audio_config["repeat_playlist"],
             )
         audio_config["target_minutes_min"] = None
@@ -1038,7 +1291,7 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
             audio_config["target_minutes_min"] = st.number_input(
                 "Min minutes",
                 min_value=0, max_value=1440,
-                value=int(cfg(config, "audio", "target_minutes_min", 10)),
+                value=int(cfg(flat, "audio", "target_minutes_min", 10)),
                 disabled=not audio_config["repeat_playlist"],
                 help="For quick tests: 5-30 min. For shorts: 60 min."
             )
@@ -1046,7 +1299,7 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
             audio_config["target_minutes_max"] = st.number_input(
                 "Max minutes",
                 min_value=0, max_value=1440,
-                value=int(cfg(config, "audio", "target_minutes_max", 15)),
+                value=int(cfg(flat, "audio", "target_minutes_max", 15)),
                 disabled=not audio_config["repeat_playlist"],
             )
         audio_config["target_hours_min"] = None
@@ -1058,12 +1311,12 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
             audio_config["concat_quality"] = st.number_input(
                 "Quality (0=best, 9=worst)",
                 min_value=0, max_value=9,
-                value=int(cfg(config, "audio", "concat_quality", 2)),
+                value=int(cfg(flat, "audio", "concat_quality", 2)),
             )
         with col2:
             audio_config["concat_bitrate"] = st.text_input(
                 "Bitrate (optional)",
-                cfg(config, "audio", "concat_bitrate", "") or "",
+                cfg(flat, "audio", "concat_bitrate", "") or "",
                 placeholder="192k"
             )
 
@@ -1072,29 +1325,29 @@ def render_audio_tab(config: dict[str, Any]) -> dict[str, Any]:
         with st.expander("Drive Credentials"):
             audio_config["use_service_account"] = st.checkbox(
                 "Use service account",
-                value=bool(cfg(config, "drive", "use_service_account", True)),
+                value=bool(cfg(flat, "drive", "use_service_account", True)),
             )
             if audio_config["use_service_account"]:
                 audio_config["service_account_json"] = st.text_input(
                     "Service account JSON path",
-                    cfg(config, "drive", "service_account_json", "secrets/drive_service_account.json"),
+                    cfg(flat, "drive", "service_account_json", "secrets/drive_service_account.json"),
                 )
                 audio_config["upload_sa"] = st.file_uploader("Upload service account JSON", type=["json"])
             else:
                 audio_config["oauth_client_json"] = st.text_input(
                     "OAuth client JSON path",
-                    cfg(config, "drive", "oauth_client_json", "secrets/drive_oauth_client.json"),
+                    cfg(flat, "drive", "oauth_client_json", "secrets/drive_oauth_client.json"),
                 )
                 audio_config["token_json"] = st.text_input(
                     "Token JSON path",
-                    cfg(config, "drive", "token_json", "secrets/drive_token.json"),
+                    cfg(flat, "drive", "token_json", "secrets/drive_token.json"),
                 )
                 audio_config["upload_oauth"] = st.file_uploader("Upload OAuth client JSON", type=["json"])
 
     return audio_config
 
 
-def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
+def render_visuals_tab(flat: FlatConfig) -> dict[str, Any]:
     """Render visuals configuration tab"""
     visuals = {}
 
@@ -1105,20 +1358,20 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         visuals["auto_background"] = st.checkbox(
             "Auto-generate background",
-            value=bool(cfg(config, "visuals", "auto_background", False)),
+            value=bool(cfg(flat, "visuals", "auto_background", False)),
             help="Generate solid color background"
         )
     with col2:
         if visuals["auto_background"]:
             visuals["background_color"] = st.text_input(
                 "Background color",
-                cfg(config, "visuals", "background_color", "black"),
+                cfg(flat, "visuals", "background_color", "black"),
             )
 
     if not visuals["auto_background"]:
         visuals["image_path"] = st.text_input(
             "Image path (leave blank to generate)",
-            cfg(config, "visuals", "image_path", "") or "",
+            cfg(flat, "visuals", "image_path", "") or "",
         )
         visuals["upload_image"] = st.file_uploader("Or upload image", type=["png", "jpg", "jpeg"])
 
@@ -1126,11 +1379,11 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
             visuals["image_provider"] = st.selectbox(
                 "Image generator",
                 ["openai", "whisk"],
-                index=0 if cfg(config, "visuals", "image_provider", "openai") == "openai" else 1,
+                index=0 if cfg(flat, "visuals", "image_provider", "openai") == "openai" else 1,
             )
             visuals["image_prompt"] = st.text_area(
                 "Image prompt",
-                cfg(config, "visuals", "image_prompt", "cozy coffee shop interior, warm light, cinematic"),
+                cfg(flat, "visuals", "image_prompt", "cozy coffee shop interior, warm light, cinematic"),
                 height=80,
             )
             st.caption("Use `{overlay_text}` and `{date}` as placeholders")
@@ -1141,13 +1394,13 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
                     with col1:
                         visuals["openai_model"] = st.text_input(
                             "Model",
-                            cfg(config, "visuals", "openai_model", "gpt-image-1"),
+                            cfg(flat, "visuals", "openai_model", "gpt-image-1"),
                         )
                     with col2:
                         visuals["openai_size"] = st.selectbox(
                             "Size",
-                            ["1792x1024", "1024x1024", "1024x1792"],
-                            index=0,
+                            OPENAI_SIZES,
+                            index=OPENAI_SIZE_IDX.get(cfg(flat, "visuals", "openai_size", "1792x1024"), 0),
                         )
 
     st.markdown("---")
@@ -1157,7 +1410,7 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
 
     visuals["loop_video_path"] = st.text_input(
         "Loop video path (leave blank to generate)",
-        cfg(config, "visuals", "loop_video_path", "") or "",
+        cfg(flat, "visuals", "loop_video_path", "") or "",
     )
     visuals["upload_loop"] = st.file_uploader("Or upload loop video", type=["mp4", "mov"])
 
@@ -1165,7 +1418,7 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
         visuals["loop_provider"] = st.selectbox(
             "Loop generator",
             ["ffmpeg", "grok"],
-            index=0 if cfg(config, "visuals", "loop_provider", "ffmpeg") == "ffmpeg" else 1,
+            index=0 if cfg(flat, "visuals", "loop_provider", "ffmpeg") == "ffmpeg" else 1,
         )
 
         if visuals["loop_provider"] == "ffmpeg":
@@ -1174,19 +1427,19 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
                 visuals["loop_duration_seconds"] = st.number_input(
                     "Duration (sec)",
                     min_value=1, max_value=30,
-                    value=int(cfg(config, "visuals", "loop_duration_seconds", 5)),
+                    value=int(cfg(flat, "visuals", "loop_duration_seconds", 5)),
                 )
             with col2:
                 visuals["fps"] = st.number_input(
                     "FPS",
                     min_value=1, max_value=60,
-                    value=int(cfg(config, "visuals", "fps", 30)),
+                    value=int(cfg(flat, "visuals", "fps", 30)),
                 )
             with col3:
                 visuals["loop_motion_style"] = st.selectbox(
                     "Motion style",
-                    ["smooth", "cinematic", "orbit"],
-                    index=1,
+                    MOTION_STYLES,
+                    index=MOTION_IDX.get(cfg(flat, "visuals", "loop_motion_style", "cinematic"), 1),
                 )
 
             col1, col2 = st.columns(2)
@@ -1194,25 +1447,21 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
                 visuals["loop_zoom_amount"] = st.slider(
                     "Zoom amount",
                     min_value=0.0, max_value=0.1, step=0.005,
-                    value=float(cfg(config, "visuals", "loop_zoom_amount", 0.02)),
+                    value=fcfg(flat, "visuals", "loop_zoom_amount", 0.02),
                 )
             with col2:
                 visuals["loop_pan_amount"] = st.slider(
                     "Pan amount",
                     min_value=0.0, max_value=0.5, step=0.05,
-                    value=float(cfg(config, "visuals", "loop_pan_amount", 0.15)),
+                    value=fcfg(flat, "visuals", "loop_pan_amount", 0.15),
                 )
 
             # Effects
-            effect_options = ["steam", "sway", "flicker", "color_drift", "vignette"]
-            default_effects = cfg(config, "visuals", "loop_effects", ["flicker", "vignette"])
-            if isinstance(default_effects, str):
-                default_effects = [e.strip() for e in default_effects.split(",") if e.strip()]
-
+            effects = cfg(flat, "visuals", "loop_effects", ("flicker", "vignette")) or ()
             visuals["loop_effects"] = st.multiselect(
                 "Effects",
-                options=effect_options,
-                default=[e for e in default_effects if e in effect_options],
+                options=EFFECT_OPTIONS,
+                default=[effect for effect in effects if effect in EFFECT_SET],
             )
 
             # Effect-specific settings
@@ -1220,24 +1469,24 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
                 with st.expander("Steam Settings"):
                     col1, col2 = st.columns(2)
                     with col1:
-                        visuals["loop_steam_opacity"] = st.slider("Opacity", 0.0, 0.2, float(cfg(config, "visuals", "loop_steam_opacity", 0.08)), 0.01)
-                        visuals["loop_steam_blur"] = st.slider("Blur", 0.0, 30.0, float(cfg(config, "visuals", "loop_steam_blur", 10.0)), 1.0)
+                        visuals["loop_steam_opacity"] = st.slider("Opacity", 0.0, 0.2, fcfg(flat, "visuals", "loop_steam_opacity", 0.08), 0.01)
+                        visuals["loop_steam_blur"] = st.slider("Blur", 0.0, 30.0, fcfg(flat, "visuals", "loop_steam_blur", 10.0), 1.0)
                     with col2:
-                        visuals["loop_steam_drift_x"] = st.slider("Drift X", 0.0, 0.1, float(cfg(config, "visuals", "loop_steam_drift_x", 0.02)), 0.005)
-                        visuals["loop_steam_drift_y"] = st.slider("Drift Y", 0.0, 0.2, float(cfg(config, "visuals", "loop_steam_drift_y", 0.05)), 0.01)
+                        visuals["loop_steam_drift_x"] = st.slider("Drift X", 0.0, 0.1, fcfg(flat, "visuals", "loop_steam_drift_x", 0.02), 0.005)
+                        visuals["loop_steam_drift_y"] = st.slider("Drift Y", 0.0, 0.2, fcfg(flat, "visuals", "loop_steam_drift_y", 0.05), 0.01)
 
             if "flicker" in visuals["loop_effects"]:
                 visuals["loop_flicker_amount"] = st.slider(
                     "Flicker amount",
                     min_value=0.0, max_value=0.05, step=0.005,
-                    value=float(cfg(config, "visuals", "loop_flicker_amount", 0.015)),
+                    value=fcfg(flat, "visuals", "loop_flicker_amount", 0.015),
                 )
 
             if "vignette" in visuals["loop_effects"]:
                 visuals["loop_vignette_angle"] = st.slider(
                     "Vignette strength",
                     min_value=0.2, max_value=1.5, step=0.05,
-                    value=safe_float(cfg(config, "visuals", "loop_vignette_angle", 0.63), 0.63),
+                    value=safe_float(cfg(flat, "visuals", "loop_vignette_angle", 0.63), 0.63),
                 )
 
     st.markdown("---")
@@ -1249,38 +1498,39 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         visuals["overlay_text"] = st.text_input(
             "Overlay text",
-            cfg(config, "text_overlay", "text", "") or "",
+            cfg(flat, "text_overlay", "text", "") or "",
             placeholder="Leave blank to use auto texts"
         )
     with col2:
         visuals["overlay_auto_mode"] = st.selectbox(
             "Auto mode",
             ["daily", "random"],
-            index=0 if cfg(config, "text_overlay", "auto_mode", "daily") == "daily" else 1,
+            index=0 if cfg(flat, "text_overlay", "auto_mode", "daily") == "daily" else 1,
         )
 
     visuals["overlay_auto_texts"] = st.text_area(
         "Auto texts (one per line)",
-        "\n".join(cfg(config, "text_overlay", "auto_texts", [])),
+        "\n".join(cfg(flat, "text_overlay", "auto_texts", ()) or ()),
         height=80,
         placeholder="LOCK IN\nFOCUS\nRELAX"
     )
+    visuals["overlay_auto_texts_list"] = split_text_lines(visuals["overlay_auto_texts"])
 
     col1, col2, col3 = st.columns(3)
     with col1:
         visuals["overlay_apply_to_video"] = st.checkbox(
             "Burn into video",
-            value=bool(cfg(config, "text_overlay", "apply_to_video", True)),
+            value=bool(cfg(flat, "text_overlay", "apply_to_video", True)),
         )
     with col2:
         visuals["overlay_create_thumbnail"] = st.checkbox(
             "Create thumbnail",
-            value=bool(cfg(config, "text_overlay", "create_thumbnail", True)),
+            value=bool(cfg(flat, "text_overlay", "create_thumbnail", True)),
         )
     with col3:
         visuals["overlay_upload_thumbnail"] = st.checkbox(
             "Upload thumbnail",
-            value=bool(cfg(config, "text_overlay", "upload_thumbnail", False)),
+            value=bool(cfg(flat, "text_overlay", "upload_thumbnail", False)),
         )
 
     with st.expander("Text Styling"):
@@ -1289,57 +1539,54 @@ def render_visuals_tab(config: dict[str, Any]) -> dict[str, Any]:
             visuals["font_size"] = st.number_input(
                 "Font size",
                 min_value=10, max_value=400,
-                value=int(cfg(config, "text_overlay", "font_size", 96)),
+                value=int(cfg(flat, "text_overlay", "font_size", 96)),
             )
         with col2:
             visuals["font_color"] = st.text_input(
                 "Font color",
-                cfg(config, "text_overlay", "font_color", "white"),
+                cfg(flat, "text_overlay", "font_color", "white"),
             )
         with col3:
             visuals["outline_color"] = st.text_input(
                 "Outline color",
-                cfg(config, "text_overlay", "outline_color", "black"),
+                cfg(flat, "text_overlay", "outline_color", "black"),
             )
         col1, col2 = st.columns(2)
         with col1:
             visuals["outline_width"] = st.number_input(
                 "Outline width",
                 min_value=0, max_value=20,
-                value=int(cfg(config, "text_overlay", "outline_width", 4)),
+                value=int(cfg(flat, "text_overlay", "outline_width", 4)),
             )
         with col2:
             visuals["letter_spacing"] = st.number_input(
                 "Letter spacing",
                 min_value=0, max_value=50,
-                value=int(cfg(config, "text_overlay", "letter_spacing", 0)),
+                value=int(cfg(flat, "text_overlay", "letter_spacing", 0)),
                 help="Extra spaces between characters (0 = normal)"
             )
         visuals["fontfile"] = st.text_input(
             "Font file path (optional)",
-            cfg(config, "text_overlay", "fontfile", "") or "",
+            cfg(flat, "text_overlay", "fontfile", "") or "",
         )
         visuals["upload_font"] = st.file_uploader(
             "Or upload font file (TTF/OTF)",
             type=["ttf", "otf"],
         )
 
-        position_options = {
-            "center": ("(w-text_w)/2", "(h-text_h)/2"),
-            "lower third": ("(w-text_w)/2", "(h-text_h)*0.75"),
-            "top": ("(w-text_w)/2", "(h-text_h)*0.15"),
-        }
         visuals["text_position"] = st.selectbox(
             "Position",
-            ["center", "lower third", "top"],
-            index=0,
+            POSITION_LABELS,
+            index=POSITION_IDX.get(
+                (cfg(flat, "text_overlay", "x", None), cfg(flat, "text_overlay", "y", None)), 0
+            ),
         )
-        visuals["overlay_x"], visuals["overlay_y"] = position_options[visuals["text_position"]]
+        visuals["overlay_x"], visuals["overlay_y"] = POSITION_OPTIONS[visuals["text_position"]]
 
     return visuals
 
 
-def render_upload_tab(config: dict[str, Any]) -> dict[str, Any]:
+def render_upload_tab(flat: FlatConfig) -> dict[str, Any]:
     """Render upload configuration tab"""
     upload = {}
 
@@ -1347,7 +1594,7 @@ def render_upload_tab(config: dict[str, Any]) -> dict[str, Any]:
 
     upload["enabled"] = st.checkbox(
         "Enable upload",
-        value=bool(cfg(config, "upload", "enabled", True)),
+        value=bool(cfg(flat, "upload", "enabled", True)),
     )
 
     if upload["enabled"]:
@@ -1355,32 +1602,30 @@ def render_upload_tab(config: dict[str, Any]) -> dict[str, Any]:
         with col1:
             upload["privacy_status"] = st.selectbox(
                 "Privacy",
-                ["public", "unlisted", "private"],
-                index=["public", "unlisted", "private"].index(
-                    cfg(config, "upload", "privacy_status", "public")
-                ),
+                PRIVACY_OPTIONS,
+                index=PRIVACY_IDX.get(cfg(flat, "upload", "privacy_status", "public"), 0),
             )
         with col2:
             upload["category_id"] = st.text_input(
                 "Category ID",
-                cfg(config, "upload", "category_id", "10"),
+                cfg(flat, "upload", "category_id", "10"),
                 help="10 = Music"
             )
 
         upload["title_template"] = st.text_input(
             "Title template",
-            cfg(config, "upload", "title_template", "Daily Chill Mix - {date}"),
+            cfg(flat, "upload", "title_template", "Daily Chill Mix - {date}"),
         )
 
         upload["description_template"] = st.text_area(
             "Description template",
-            cfg(config, "upload", "description_template", "Longform ambient mix. Generated daily."),
+            cfg(flat, "upload", "description_template", "Longform ambient mix. Generated daily."),
             height=100,
         )
 
         upload["tags"] = st.text_input(
             "Tags (comma-separated)",
-            ", ".join(cfg(config, "upload", "tags", ["ambient", "chill", "lofi"])),
+            ", ".join(cfg(flat, "upload", "tags", ["ambient", "chill", "lofi"])),
         )
 
         # YouTube Authentication
@@ -1424,17 +1669,17 @@ def render_upload_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         upload["tracklist_enabled"] = st.checkbox(
             "Generate timestamps",
-            value=bool(cfg(config, "tracklist", "enabled", True)),
+            value=bool(cfg(flat, "tracklist", "enabled", True)),
         )
     with col2:
         upload["embed_chapters"] = st.checkbox(
             "Embed chapters in MP4",
-            value=bool(cfg(config, "tracklist", "embed_chapters", True)),
+            value=bool(cfg(flat, "tracklist", "embed_chapters", True)),
         )
 
     upload["append_to_description"] = st.checkbox(
         "Append to description",
-        value=bool(cfg(config, "tracklist", "append_to_description", True)),
+        value=bool(cfg(flat, "tracklist", "append_to_description", True)),
     )
 
     st.markdown("---")
@@ -1446,23 +1691,23 @@ def render_upload_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         upload["resolution"] = st.text_input(
             "Resolution",
-            cfg(config, "video", "resolution", "1920x1080"),
+            cfg(flat, "video", "resolution", "1920x1080"),
         )
     with col2:
         upload["video_bitrate"] = st.text_input(
             "Video bitrate",
-            cfg(config, "video", "video_bitrate", "4500k"),
+            cfg(flat, "video", "video_bitrate", "4500k"),
         )
     with col3:
         upload["audio_bitrate"] = st.text_input(
             "Audio bitrate",
-            cfg(config, "video", "audio_bitrate", "192k"),
+            cfg(flat, "video", "audio_bitrate", "192k"),
         )
 
     return upload
 
 
-def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
+def render_simple_tab(flat: FlatConfig) -> dict[str, Any]:
     """Render the simplified beginner-friendly tab"""
     simple = {}
 
@@ -1590,14 +1835,14 @@ def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         simple["local_folder"] = st.text_input(
             "Folder with your MP3 files",
-            cfg(config, "audio", "local_folder", ""),
+            cfg(flat, "audio", "local_folder", ""),
             placeholder="C:\\Users\\YourName\\Music or /home/username/music",
             key="simple_audio_folder"
         )
     with col2:
         simple["recursive"] = st.checkbox(
             "Include subfolders",
-            value=bool(cfg(config, "audio", "recursive", True)),
+            value=bool(cfg(flat, "audio", "recursive", True)),
             key="simple_recursive"
         )
 
@@ -1609,7 +1854,7 @@ def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         simple["overlay_text"] = st.text_input(
             "Text to display",
-            cfg(config, "text_overlay", "text", "LOCK IN"),
+            cfg(flat, "text_overlay", "text", "LOCK IN"),
             placeholder="e.g., FOCUS, RELAX, STUDY",
             key="simple_overlay_text"
         )
@@ -1626,7 +1871,7 @@ def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
     if simple["auto_mode"] in ["daily", "random"]:
         simple["auto_texts"] = st.text_area(
             "Texts to rotate through (one per line)",
-            "\n".join(cfg(config, "text_overlay", "auto_texts", ["LOCK IN", "FOCUS", "RELAX"])),
+            "\n".join(cfg(flat, "text_overlay", "auto_texts", ("LOCK IN", "FOCUS", "RELAX")) or ()),
             height=80,
             key="simple_auto_texts"
         )
@@ -1648,7 +1893,7 @@ def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col2:
         simple["privacy"] = st.selectbox(
             "Privacy",
-            ["public", "unlisted", "private"],
+            PRIVACY_OPTIONS,
             index=0,
             help="public = anyone can see, unlisted = only with link, private = only you",
             key="simple_privacy"
@@ -1679,7 +1924,7 @@ def render_simple_tab(config: dict[str, Any]) -> dict[str, Any]:
     return simple
 
 
-def render_settings_tab(config: dict[str, Any]) -> dict[str, Any]:
+def render_settings_tab(flat: FlatConfig) -> dict[str, Any]:
     """Render settings/schedule tab"""
     settings = {}
 
@@ -1689,12 +1934,12 @@ def render_settings_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         settings["project_name"] = st.text_input(
             "Project name",
-            cfg(config, "project", "name", "daily_chill_mix"),
+            cfg(flat, "project", "name", "daily_chill_mix"),
         )
     with col2:
         settings["output_dir"] = st.text_input(
             "Output folder",
-            cfg(config, "project", "output_dir", "runs"),
+            cfg(flat, "project", "output_dir", "runs"),
         )
 
     st.markdown("---")
@@ -1706,12 +1951,12 @@ def render_settings_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         settings["schedule_enabled"] = st.checkbox(
             "Enable daily schedule",
-            value=bool(cfg(config, "schedule", "enabled", True)),
+            value=bool(cfg(flat, "schedule", "enabled", True)),
         )
     with col2:
         settings["daily_time"] = st.text_input(
             "Daily time (HH:MM)",
-            cfg(config, "schedule", "daily_time", "03:00"),
+            cfg(flat, "schedule", "daily_time", "03:00"),
         )
 
     st.markdown("---")
@@ -1723,14 +1968,14 @@ def render_settings_tab(config: dict[str, Any]) -> dict[str, Any]:
     with col1:
         settings["test_enabled"] = st.checkbox(
             "Enable test mode",
-            value=bool(cfg(config, "test", "enabled", False)),
+            value=bool(cfg(flat, "test", "enabled", False)),
             help="No upload, no repeat"
         )
     with col2:
         settings["test_max_minutes"] = st.number_input(
             "Max minutes (0 = full)",
             min_value=0, max_value=720,
-            value=int(cfg(config, "test", "max_minutes", 0) or 0),
+            value=int(cfg(flat, "test", "max_minutes", 0) or 0),
         )
 
     st.markdown("---")
@@ -1740,15 +1985,15 @@ def render_settings_tab(config: dict[str, Any]) -> dict[str, Any]:
 
     preset_choice = st.selectbox(
         "Load preset",
-        ["None"] + sorted(PRESETS.keys()),
+        PRESET_CHOICES,
     )
 
     if st.button("Apply Preset"):
         if preset_choice != "None":
-            st.session_state.config = apply_preset(
+            set_config(apply_preset(
                 st.session_state.config,
                 PRESETS[preset_choice],
-            )
+            ))
             st.success(f"Applied '{preset_choice}' preset")
             st.rerun()
 
@@ -1762,43 +2007,41 @@ def build_full_config(
     settings: dict[str, Any],
     config: dict[str, Any],
 ) -> dict[str, Any]:
-    """Build the complete config dict from all tabs"""
+    """Build the complete config dict from all tabs
 
-    # Handle uploaded files
-    saved_image_path = visuals.get("image_path", "")
-    if visuals.get("upload_image"):
-        saved_image_path = save_uploaded_file(visuals["upload_image"], ASSETS_DIR / "image.png")
+    Tab values are merged over the current config, so keys the UI does not
+    edit (e.g. visuals.whisk_command) are kept.
+    """
 
-    saved_loop_path = visuals.get("loop_video_path", "")
-    if visuals.get("upload_loop"):
-        saved_loop_path = save_uploaded_file(visuals["upload_loop"], ASSETS_DIR / "loop.mp4")
-
-    saved_font_path = visuals.get("fontfile", "") or ""
+    # Handle uploaded files
+    tabs = {"audio": audio, "visuals": visuals, "upload": upload}
+    uploads: dict[str, tuple[Any, Path]] = {
+        name: (tabs[tab].get(field), dest) for name, (tab, field, dest) in UPLOAD_SPECS.items()
+    }
     if visuals.get("upload_font"):
-        suffix = Path(visuals["upload_font"].name).suffix or ".ttf"
-        saved_font_path = save_uploaded_file(
-            visuals["upload_font"],
-            ASSETS_DIR / f"overlay_font{suffix}",
-        )
+        suffix = _ext(visuals["upload_font"].name, ".ttf")
+        uploads["font"] = (visuals["upload_font"], ASSETS_DIR / f"overlay_font{suffix}")
 
-    saved_audio_folder = audio.get("local_folder", "")
+    audio_upload_dir = None
     if audio.get("source") == "local" and audio.get("uploaded_files"):
         timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
         audio_upload_dir = ASSETS_DIR / "audio_uploads" / timestamp
-        audio_upload_dir.mkdir(parents=True, exist_ok=True)
         for up in audio["uploaded_files"]:
             filename = Path(up.name).name
-            (audio_upload_dir / filename).write_bytes(up.getvalue())
+            uploads[f"audio/{filename}"] = (up, audio_upload_dir / filename)
+
+    saved = save_uploaded_files(uploads)
+    saved_image_path = saved.get("image", visuals.get("image_path", ""))
+    saved_loop_path = saved.get("loop", visuals.get("loop_video_path", ""))
+    saved_font_path = saved.get("font", visuals.get("fontfile", "") or "")
+    saved_youtube_client = saved.get(
+        "youtube_client", upload.get("credentials_json", "secrets/youtube_client.json")
+    )
+    saved_audio_folder = audio.get("local_folder", "")
+    if audio_upload_dir is not None:
         saved_audio_folder = path_for_config(audio_upload_dir)
 
-    saved_youtube_client = upload.get("credentials_json", "secrets/youtube_client.json")
-    if upload.get("upload_youtube_client"):
-        saved_youtube_client = save_uploaded_file(
-            upload["upload_youtube_client"],
-            SECRETS_DIR / "youtube_client.json"
-        )
-
-    return {
+    updates = {
         "project": {
             "name": settings.get("project_name", "daily_chill_mix"),
             "output_dir": settings.get("output_dir", "runs"),
@@ -1820,8 +2063,8 @@ def build_full_config(
         },
         "drive": {
             "use_service_account": audio.get("use_service_account", True),
-            "service_account_json": audio.get("service_account_json") or None,
-            "oauth_client_json": audio.get("oauth_client_json") or None,
+            "service_account_json": saved.get("service_account", audio.get("service_account_json")) or None,
+            "oauth_client_json": saved.get("oauth_client", audio.get("oauth_client_json")) or None,
             "token_json": audio.get("token_json") or None,
         },
         "visuals": {
@@ -1832,7 +2075,6 @@ def build_full_config(
             "image_path": saved_image_path or None,
             "loop_video_path": saved_loop_path or None,
             "image_provider": visuals.get("image_provider", "openai"),
-            "openai_api_key_env": cfg(config, "visuals", "openai_api_key_env", "OPENAI_API_KEY"),
             "openai_model": visuals.get("openai_model", "gpt-image-1"),
             "openai_size": visuals.get("openai_size", "1792x1024"),
             "loop_provider": visuals.get("loop_provider", "ffmpeg"),
@@ -1852,7 +2094,7 @@ def build_full_config(
         },
         "text_overlay": {
             "text": visuals.get("overlay_text") or None,
-            "auto_texts": split_text_lines(visuals.get("overlay_auto_texts", "")),
+            "auto_texts": list(visuals.get("overlay_auto_texts_list", ())),
             "auto_mode": visuals.get("overlay_auto_mode", "daily"),
             "font_size": int(visuals.get("font_size", 96)),
             "font_color": visuals.get("font_color", "white"),
@@ -1900,6 +2142,11 @@ def build_full_config(
             "daily_time": settings.get("daily_time", "03:00"),
         },
     }
+    # Edited sections are replaced with merged copies, never changed in place.
+    config_out = dict(config)
+    for section, values in updates.items():
+        config_out[section] = {**(config.get(section) or {}), **values}
+    return config_out
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1922,15 +2169,16 @@ def main() -> None:
         st.stop()
 
     # Load config
-    if "config" not in st.session_state:
-        st.session_state.config = load_config()
+    if "config_flat" not in st.session_state:
+        set_config(st.session_state.get("config") or load_config())
     config = st.session_state.config
+    flat = st.session_state.config_flat
 
     # Demo mode
     demo_mode = os.getenv("DEMO_MODE") == "1"
 
     # Render sidebar and get actions
-    actions = render_sidebar(config, demo_mode)
+    actions = render_sidebar(flat, demo_mode)
 
     # Header
     st.markdown("# Video Creator Agent")
@@ -1953,22 +2201,22 @@ def main() -> None:
     simple_config = {}
 
     with tab_simple:
-        simple_config = render_simple_tab(config)
+        simple_config = render_simple_tab(flat)
 
     with tab_dashboard:
-        render_dashboard_tab(config)
+        render_dashboard_tab(flat)
 
     with tab_audio:
-        audio_config = render_audio_tab(config)
+        audio_config = render_audio_tab(flat)
 
     with tab_visuals:
-        visuals_config = render_visuals_tab(config)
+        visuals_config = render_visuals_tab(flat)
 
     with tab_upload:
-        upload_config = render_upload_tab(config)
+        upload_config = render_upload_tab(flat)
 
     with tab_settings:
-        settings_config = render_settings_tab(config)
+        settings_config = render_settings_tab(flat)
 
     # Save button (fixed at bottom)
     st.markdown("---")
@@ -1976,21 +2224,28 @@ def main() -> None:
     col1, col2, col3 = st.columns([1, 1, 2])
 
     with col1:
-        if st.button(" Save Configuration", disabled=demo_mode, use_container_width=True):
-            full_config = build_full_config(
-                audio_config, visuals_config, upload_config, settings_config, config
-            )
-            save_config(full_config)
-            st.session_state.config = full_config
-            st.success("Configuration saved")
+        save_clicked = st.button(" Save Configuration", disabled=demo_mode, use_container_width=True)
+
+    # Building the config writes uploaded files, so only do it when something saves.
+    full_config: dict[str, Any] = {}
+    if save_clicked or any(actions[name] for name in CONFIG_SAVING_ACTIONS):
+        full_config = build_full_config(
+            audio_config, visuals_config, upload_config, settings_config, config
+        )
+
+    if save_clicked:
+        save_config(full_config)
+        set_config(full_config)
+        col1.success("Configuration saved")
 
     with col2:
         # Preview thumbnail button
         if st.button(" Preview Thumbnail", use_container_width=True):
-            auto_texts = split_text_lines(visuals_config.get("overlay_auto_texts", ""))
+            from src.utils.ffmpeg import build_drawtext_filter, render_image_with_text
+
             selected_text = select_overlay_text(
                 visuals_config.get("overlay_text", ""),
-                auto_texts,
+                visuals_config.get("overlay_auto_texts_list", []),
                 visuals_config.get("overlay_auto_mode", "daily"),
             )
             if not selected_text:
@@ -2006,35 +2261,24 @@ def main() -> None:
                     spacer = " " * letter_spacing
                     lines = selected_text.split("\n")
                     display_text = "\n".join(spacer.join(list(line)) for line in lines)
-                preview_text_path.write_text(display_text, encoding="utf-8")
+                _write_bytes_if_changed(preview_text_path, display_text.encode("utf-8"))
 
                 # Determine preview image
-                preview_image_path = None
-                if visuals_config.get("upload_image"):
-                    suffix = Path(visuals_config["upload_image"].name).suffix or ".png"
-                    preview_image_path = preview_dir / f"preview_base{suffix}"
-                    preview_image_path.write_bytes(visuals_config["upload_image"].getvalue())
-                elif visuals_config.get("image_path"):
-                    resolved = resolve_path(visuals_config["image_path"])
-                    if resolved.exists():
-                        preview_image_path = resolved
-                elif visuals_config.get("auto_background"):
-                    preview_image_path = preview_dir / "preview_base.png"
-                    generate_color_image(
-                        preview_image_path,
-                        resolution=upload_config.get("resolution", "1920x1080"),
-                        color=visuals_config.get("background_color", "black"),
-                    )
+                preview_image_path = resolve_preview_image(
+                    visuals_config,
+                    preview_dir,
+                    upload_config.get("resolution", "1920x1080"),
+                )
                 if not preview_image_path:
                     st.warning("Preview needs an image path, upload, or auto background.")
                 else:
                     font_path = None
                     if visuals_config.get("upload_font"):
-                        suffix = Path(visuals_config["upload_font"].name).suffix or ".ttf"
+                        suffix = _ext(visuals_config["upload_font"].name, ".ttf")
                         font_path = preview_dir / f"preview_font{suffix}"
-                        font_path.write_bytes(visuals_config["upload_font"].getvalue())
+                        _write_bytes_if_changed(font_path, visuals_config["upload_font"].getbuffer())
                     elif visuals_config.get("fontfile"):
-                        resolved_font = resolve_path(visuals_config["fontfile"])
+                        resolved_font = resolve_path(visuals_config["fontfile"], ROOT)
                         if resolved_font.exists():
                             font_path = resolved_font
                     if font_path is None:
@@ -2051,28 +2295,43 @@ def main() -> None:
                         border_width=int(visuals_config.get("outline_width", 4)),
                     )
                     preview_output = preview_dir / "thumbnail_preview.png"
-                    try:
-                        render_image_with_text(preview_image_path, preview_output, drawtext_filter)
-                        st.session_state.preview_path = str(preview_output)
+                    render_key = preview_render_key(
+                        drawtext_filter, display_text, preview_image_path, font_path
+                    )
+                    if (
+                        st.session_state.get("preview_render_key") == render_key
+                        and st.session_state.get("preview_bytes")
+                    ):
                         st.success(f"Preview: {selected_text}")
-                    except RuntimeError as exc:
-                        st.error(f"Preview failed: {exc}")
+                    else:
+                        try:
+                            render_image_with_text(
+                                preview_image_path, preview_output, drawtext_filter,
+                                compression_level=1,
+                            )
+                            st.session_state.preview_bytes = preview_output.read_bytes()
+                            st.session_state.preview_render_key = render_key
+                            st.success(f"Preview: {selected_text}")
+                        except RuntimeError as exc:
+                            st.error(f"Preview failed: {exc}")
 
     # Show preview if available
-    preview_path = st.session_state.get("preview_path")
-    if preview_path and Path(preview_path).exists():
+    preview_bytes = st.session_state.get("preview_bytes")
+    if preview_bytes:
         st.markdown("### Thumbnail Preview")
-        st.image(preview_path, use_container_width=True)
+        st.image(preview_bytes, use_container_width=True)
 
     # Handle sidebar actions
     if actions["run_preview"]:
-        full_config = build_full_config(
-            audio_config, visuals_config, upload_config, settings_config, config
-        )
         save_config(full_config)
         with st.spinner("Generating 30-second preview..."):
             # Run with 0.5 minutes (30 seconds) for quick preview
-            code, output = run_agent_once_cli(CONFIG_PATH, test_mode=True, test_minutes=1)
+            live_output = st.empty()
+            code, output = run_agent_once_cli(
+                CONFIG_PATH, test_mode=True, test_minutes=1,
+                on_output=lambda text: live_output.code(text, language="text"),
+            )
+            live_output.empty()
         st.session_state.last_run_output = output
         if code == 0:
             # Try to find the output video
@@ -2087,29 +2346,26 @@ def main() -> None:
             st.error("Preview failed")
 
     if actions["run_test"]:
-        full_config = build_full_config(
-            audio_config, visuals_config, upload_config, settings_config, config
-        )
         save_config(full_config)
         test_minutes = int(settings_config.get("test_max_minutes", 10) or 10)
         with st.spinner("Running test..."):
-            code, output = run_agent_once_cli(CONFIG_PATH, test_mode=True, test_minutes=test_minutes)
+            live_output = st.empty()
+            code, output = run_agent_once_cli(
+                CONFIG_PATH, test_mode=True, test_minutes=test_minutes,
+                on_output=lambda text: live_output.code(text, language="text"),
+            )
+            live_output.empty()
         st.session_state.last_run_output = output
         if code == 0:
             st.success("Test completed")
         else:
             st.error("Test failed")
 
-    if actions["run_full"]:
-        full_config = build_full_config(
-            audio_config, visuals_config, upload_config, settings_config, config
-        )
-        save_config(full_config)
-        pid = start_background(
-            [sys.executable, "-m", "src.agent", "--config", str(CONFIG_PATH), "--once"],
-            FULLRUN_PID_PATH, FULLRUN_LOG_PATH,
-        )
-        st.success(f"Full run started (PID {pid})")
+    for name, spec in BACKGROUND_ACTIONS.items():
+        if actions[name]:
+            save_config(full_config)
+            pid = start_background(spec["args"], spec["pid_path"], spec["log_path"])
+            st.success(f"{spec['label']} started (PID {pid})")
 
     if actions["stop_full"]:
         if stop_background(FULLRUN_PID_PATH):
@@ -2117,17 +2373,6 @@ def main() -> None:
         else:
             st.info("No running job found")
 
-    if actions["start_schedule"]:
-        full_config = build_full_config(
-            audio_config, visuals_config, upload_config, settings_config, config
-        )
-        save_config(full_config)
-        pid = start_background(
-            [sys.executable, "-m", "src.agent", "--config", str(CONFIG_PATH)],
-            SCHEDULE_PID_PATH, SCHEDULE_LOG_PATH,
-        )
-        st.success(f"Schedule started (PID {pid})")
-
     if actions["stop_schedule"]:
         if stop_background(SCHEDULE_PID_PATH):
             st.success("Schedule stopped")
@@ -2221,12 +2466,10 @@ def main() -> None:
             simple_full_config["upload"]["token_json"] = str(token_path)
 
         save_config(simple_full_config)
-        st.session_state.config = simple_full_config
+        set_config(simple_full_config)
 
-        pid = start_background(
-            [sys.executable, "-m", "src.agent", "--config", str(CONFIG_PATH), "--once"],
-            FULLRUN_PID_PATH, FULLRUN_LOG_PATH,
-        )
+        run_full = BACKGROUND_ACTIONS["run_full"]
+        pid = start_background(run_full["args"], run_full["pid_path"], run_full["log_path"])
         st.success(f"Video generation started! (PID {pid})")
         st.info("This will take 30-60 minutes. You can close this tab and come back later.")
 